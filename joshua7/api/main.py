@@ -3,31 +3,56 @@
 from __future__ import annotations
 
 import logging
-import time
-import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from joshua7 import __version__
+from joshua7.api.middleware import (
+    APIKeyMiddleware,
+    BodyLimitMiddleware,
+    RequestContextMiddleware,
+)
 from joshua7.api.routes import router
 from joshua7.config import get_settings
 from joshua7.engine import ValidationEngine
 
 logger = logging.getLogger(__name__)
 
+API_PREFIX = "/api/v1"
+
 
 def create_app() -> FastAPI:
     settings = get_settings()
+    engine = ValidationEngine(settings=settings)
+    engine.warmup()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        yield
+        engine.close()
 
     app = FastAPI(
         title=settings.app_name,
         version=__version__,
         description="Pre-publication AI content validation engine",
-        docs_url="/docs",
-        redoc_url="/redoc",
+        # The schema and docs pages are only served in debug mode; otherwise
+        # they are neither exposed nor built.
+        docs_url="/docs" if settings.debug else None,
+        redoc_url="/redoc" if settings.debug else None,
+        openapi_url="/openapi.json" if settings.debug else None,
+        lifespan=lifespan,
     )
 
+    # Middleware added later wraps earlier additions. The key and body-size
+    # checks sit inside CORS so their rejections still carry CORS headers and
+    # preflights need no key; the request-context layer is outermost so every
+    # response gets its headers.
+    if settings.api_key:
+        app.add_middleware(APIKeyMiddleware, api_key=settings.api_key, path_prefix=API_PREFIX)
+    app.add_middleware(BodyLimitMiddleware, max_bytes=settings.max_request_bytes)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_allowed_origins,
@@ -37,24 +62,10 @@ def create_app() -> FastAPI:
     )
 
     app.state.settings = settings
-    app.state.engine = ValidationEngine(settings=settings)
-
-    app.include_router(router, prefix="/api/v1")
-
-    @app.middleware("http")
-    async def add_request_context(request: Request, call_next) -> Response:  # noqa: ANN001
-        request_id = request.headers.get("X-Request-ID", uuid.uuid4().hex)
-        request.state.request_id = request_id
-        start = time.monotonic()
-        response: Response = await call_next(request)
-        elapsed_ms = round((time.monotonic() - start) * 1000, 2)
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Response-Time-Ms"] = str(elapsed_ms)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Cache-Control"] = "no-store"
-        response.headers["Referrer-Policy"] = "no-referrer"
-        return response
+    app.state.engine = engine
+
+    app.include_router(router, prefix=API_PREFIX)
+    app.add_middleware(RequestContextMiddleware)
 
     @app.get("/health")
     async def health() -> dict[str, str]:
@@ -0,0 +1,177 @@
+"""Pure ASGI middleware for the Joshua 7 API."""
+
+from __future__ import annotations
+
+import hmac
+import re
+import secrets
+import time
+
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Added to every HTTP response, after the request-context headers.
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"cache-control", b"no-store"),
+    (b"referrer-policy", b"no-referrer"),
+)
+
+
+# Client-supplied request IDs are echoed in headers, logs and the response
+# body, so only short IDs made of URL-safe characters are accepted; anything
+# else is replaced with a fresh one.
+_SAFE_REQUEST_ID = re.compile(rb"[A-Za-z0-9_-]{1,64}")
+
+
+def _header(scope: Scope, name: bytes) -> bytes | None:
+    """Return the first raw value of header *name* (lowercase) in *scope*."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+async def _send_json(send: Send, status: int, body: bytes) -> None:
+    """Answer the request directly with a JSON *body* and *status*."""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def _route_path(scope: Scope) -> str:
+    """Return ``scope["path"]`` without the ``root_path`` the app is mounted under.
+
+    Servers started with a root path include it in ``scope["path"]``; it is
+    stripped only when it is a whole leading segment of the path.
+    """
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        rest = path[len(root_path):]
+        if not rest or rest.startswith("/"):
+            return rest or "/"
+    return path
+
+
+class RequestContextMiddleware:
+    """Assign a request ID, time the request and add security headers.
+
+    A safe ``X-Request-ID`` from the client is kept; a missing or malformed
+    one is replaced with a random hex ID.
+
+    Implemented against the raw ASGI interface rather than
+    ``BaseHTTPMiddleware``, so no ``Request``/``Response`` objects or extra
+    task are created per request: the request ID goes into ``scope["state"]``
+    (where ``request.state`` reads it) and the headers are appended to the
+    ``http.response.start`` message as it is sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        raw_id = _header(scope, b"x-request-id")
+        if raw_id is None or not _SAFE_REQUEST_ID.fullmatch(raw_id):
+            raw_id = secrets.token_hex(16).encode("ascii")
+        request_id = raw_id.decode("ascii")
+        scope.setdefault("state", {})["request_id"] = request_id
+        start = time.monotonic()
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = round((time.monotonic() - start) * 1000, 2)
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-request-id", raw_id),
+                    (b"x-response-time-ms", str(elapsed_ms).encode("latin-1")),
+                    *_SECURITY_HEADERS,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+_UNAUTHORIZED_BODY = b'{"detail":"Invalid or missing API key"}'
+
+
+class APIKeyMiddleware:
+    """Require a matching ``X-API-Key`` header on paths under *path_prefix*.
+
+    The prefix is matched against the route path, i.e. ``scope["path"]``
+    without any ``root_path`` the app is mounted under, as routing sees it.
+    The raw header bytes are compared with ``hmac.compare_digest`` straight
+    from ``scope["headers"]``, and a rejected request is answered with a 401
+    without entering routing, dependency resolution or body parsing.
+    """
+
+    def __init__(self, app: ASGIApp, api_key: str, path_prefix: str) -> None:
+        self.app = app
+        self._expected = api_key.encode("utf-8")
+        self._path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and _route_path(scope).startswith(self._path_prefix):
+            supplied = _header(scope, b"x-api-key")
+            if supplied is None or not hmac.compare_digest(supplied, self._expected):
+                await _send_json(send, 401, _UNAUTHORIZED_BODY)
+                return
+        await self.app(scope, receive, send)
+
+
+_TOO_LARGE_BODY = b'{"detail":"Request body too large"}'
+_BAD_LENGTH_BODY = b'{"detail":"Invalid Content-Length header"}'
+
+
+class BodyLimitMiddleware:
+    """Reject HTTP requests whose body exceeds *max_bytes* with a 413.
+
+    A declared ``Content-Length`` is checked from ``scope["headers"]`` before
+    any of the body is read; one that is not a decimal byte count is
+    answered with a 400. Bodies sent without one are counted as they are
+    received, and the read fails with a 413 once the limit is passed.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        self.app = app
+        self._max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        declared = _header(scope, b"content-length")
+        if declared is not None:
+            if not declared.isdigit():
+                await _send_json(send, 400, _BAD_LENGTH_BODY)
+                return
+            if int(declared) > self._max_bytes:
+                await _send_json(send, 413, _TOO_LARGE_BODY)
+                return
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_limited() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self._max_bytes:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+            return message
+
+        await self.app(scope, receive_limited, send)
@@ -42,6 +42,11 @@ class Settings(BaseSettings):
     log_level: str = "info"
 
     max_text_length: int = 500_000
+    max_request_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        ge=1,
+        description="Largest request body the API accepts before answering 413.",
+    )
 
     forbidden_phrases: list[str] = Field(default_factory=lambda: list(_DEFAULT_FORBIDDEN_PHRASES))
     pii_patterns_enabled: list[str] = Field(
@@ -55,6 +60,26 @@ class Settings(BaseSettings):
     readability_min_score: float = 30.0
     readability_max_score: float = 80.0
 
+    fail_fast: bool = Field(
+        default=False,
+        description="Stop after a CRITICAL finding from a fail-fast validator.",
+    )
+    fail_fast_validators: list[str] = Field(
+        default_factory=lambda: ["prompt_injection", "pii"]
+    )
+
+    max_findings_per_validator: int = Field(
+        default=1000,
+        ge=0,
+        description="Most findings one validator reports; extra matches still fail it. 0 disables.",
+    )
+
+    result_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Number of recent inputs whose results are reused verbatim. 0 disables.",
+    )
+
     cors_allowed_origins: list[str] = Field(
         default_factory=lambda: ["*"],
         description="Allowed CORS origins. Set to specific domains in production.",
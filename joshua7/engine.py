@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-import uuid
+import secrets
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
 from joshua7 import __version__
 from joshua7.config import Settings, get_settings
 from joshua7.models import (
+    BatchValidationRequest,
+    BatchValidationResponse,
     RiskAxis,
     RiskTaxonomy,
     Severity,
@@ -17,7 +25,8 @@ from joshua7.models import (
     ValidationResponse,
     ValidationResult,
 )
-from joshua7.sanitize import sanitize_input
+from joshua7.regex_guard import regex_timeouts
+from joshua7.sanitize import lower_preserving_offsets, sanitize_input
 from joshua7.validators.base import BaseValidator
 from joshua7.validators.brand_voice import BrandVoiceScorer
 from joshua7.validators.forbidden_phrases import ForbiddenPhraseDetector
@@ -35,6 +44,10 @@ _REGISTRY: dict[str, type[BaseValidator]] = {
     "readability": ReadabilityScorer,
 }
 
+# Canonical validator names. Request-supplied names are interned onto these
+# so results, findings and risk routing all share one string object per name.
+_VALIDATOR_NAMES: tuple[str, ...] = tuple(sys.intern(n) for n in _REGISTRY)
+
 # ---------------------------------------------------------------------------
 # RISK_TAXONOMY_v0 — weighted composite scoring
 # ---------------------------------------------------------------------------
@@ -59,6 +72,36 @@ _RISK_AXES: list[dict[str, Any]] = [
 ]
 
 
+# Inverse routing table: validator name -> indices of the axes it feeds.
+# Scoring walks the results once and scatters each validator's points into
+# per-axis accumulators, instead of probing a name->result map per axis.
+_AXIS_WEIGHTS: tuple[float, ...] = tuple(a["weight"] for a in _RISK_AXES)
+
+
+def _build_validator_axis_index() -> dict[str, tuple[int, ...]]:
+    index: dict[str, list[int]] = {}
+    for i, axis_def in enumerate(_RISK_AXES):
+        for vname in axis_def["validators"]:
+            index.setdefault(vname, []).append(i)
+    return {vname: tuple(idxs) for vname, idxs in index.items()}
+
+
+_VALIDATOR_TO_AXES: dict[str, tuple[int, ...]] = _build_validator_axis_index()
+
+# RiskAxis is frozen, so axes with no contributing validator (empty or
+# subset runs) share these instances instead of allocating fresh zeros.
+_ZERO_AXES: tuple[RiskAxis, ...] = tuple(
+    RiskAxis(
+        axis=a["axis"],
+        label=a["label"],
+        weight=a["weight"],
+        raw_score=0.0,
+        weighted_score=0.0,
+    )
+    for a in _RISK_AXES
+)
+
+
 def _risk_level(score: float) -> str:
     if score < 20:
         return "GREEN"
@@ -69,39 +112,26 @@ def _risk_level(score: float) -> str:
     return "RED"
 
 
-def _axis_score_from_results(
-    validator_names: list[str],
-    results_map: dict[str, ValidationResult],
-) -> float:
-    """Derive a 0-100 raw axis score from the mapped validators' findings."""
-    total_points = 0.0
-    contributor_count = 0
-
-    for vname in validator_names:
-        result = results_map.get(vname)
-        if result is None:
-            continue
-        contributor_count += 1
-
-        if result.passed and not result.findings:
-            continue
+def _result_points(result: ValidationResult) -> tuple[float, bool]:
+    """Derive a 0-100 risk contribution from a single validator result.
 
-        if not result.passed and result.score is not None:
-            inverted = max(0.0, 100.0 - result.score)
-            total_points += inverted
-            continue
-
-        finding_points = sum(
-            _SEVERITY_POINTS.get(f.severity, 0) for f in result.findings
-        )
-        total_points += min(finding_points, 100.0)
+    Also reports whether any finding is CRITICAL, so the caller does not
+    walk the findings a second time.
+    """
+    findings = result.findings
+    if not result.passed and result.score is not None:
+        has_critical = any(f.severity is Severity.CRITICAL for f in findings)
+        return max(0.0, 100.0 - result.score), has_critical
+    if not findings:
+        return 0.0, False
 
-    if contributor_count == 0:
-        return 0.0
-    return min(total_points / contributor_count, 100.0)
+    severities = [f.severity for f in findings]
+    has_critical = Severity.CRITICAL in severities
+    finding_points = sum(map(_SEVERITY_POINTS.__getitem__, severities))
+    return min(finding_points, 100.0), has_critical
 
 
-def _critical_escalation(results: list[ValidationResult]) -> float:
+def _critical_escalation(critical_axes: int) -> float:
     """Return an escalation bonus based on CRITICAL-severity findings.
 
     CRITICAL findings represent hard failures (PII leaks, active injection
@@ -112,47 +142,52 @@ def _critical_escalation(results: list[ValidationResult]) -> float:
         2 CRITICAL axes  → +80  (guarantees RED with any non-zero base)
         3+ CRITICAL axes → +100 (hard RED)
     """
-    axes_with_criticals: set[str] = set()
-    results_map = {r.validator_name: r for r in results}
-
-    for axis_def in _RISK_AXES:
-        for vname in axis_def["validators"]:
-            result = results_map.get(vname)
-            if result is None:
-                continue
-            if any(f.severity == Severity.CRITICAL for f in result.findings):
-                axes_with_criticals.add(axis_def["axis"])
-                break
-
-    n = len(axes_with_criticals)
-    if n == 0:
+    if critical_axes == 0:
         return 0.0
-    if n == 1:
+    if critical_axes == 1:
         return 40.0
-    if n == 2:
+    if critical_axes == 2:
         return 80.0
     return 100.0
 
 
 def compute_risk_taxonomy(results: list[ValidationResult]) -> RiskTaxonomy:
     """Build a RISK_TAXONOMY_v0 from a list of validator results."""
-    results_map = {r.validator_name: r for r in results}
+    n_axes = len(_RISK_AXES)
+    points = [0.0] * n_axes
+    contributors = [0] * n_axes
+    critical = [False] * n_axes
+
+    for result in results:
+        axis_idxs = _VALIDATOR_TO_AXES.get(result.validator_name)
+        if not axis_idxs:
+            continue
+        result_points, has_critical = _result_points(result)
+        for i in axis_idxs:
+            points[i] += result_points
+            contributors[i] += 1
+            if has_critical:
+                critical[i] = True
+
     axes: list[RiskAxis] = []
     weighted_sum = 0.0
 
-    for axis_def in _RISK_AXES:
-        raw = _axis_score_from_results(axis_def["validators"], results_map)
-        weighted = raw * axis_def["weight"]
+    for i, axis_def in enumerate(_RISK_AXES):
+        if not contributors[i]:
+            axes.append(_ZERO_AXES[i])
+            continue
+        raw = min(points[i] / contributors[i], 100.0)
+        weighted = raw * _AXIS_WEIGHTS[i]
         weighted_sum += weighted
         axes.append(RiskAxis(
             axis=axis_def["axis"],
             label=axis_def["label"],
-            weight=axis_def["weight"],
+            weight=_AXIS_WEIGHTS[i],
             raw_score=round(raw, 1),
             weighted_score=round(weighted, 2),
         ))
 
-    escalation = _critical_escalation(results)
+    escalation = _critical_escalation(sum(critical))
     composite = round(min(weighted_sum + escalation, 100.0), 1)
 
     return RiskTaxonomy(
@@ -165,8 +200,9 @@ def compute_risk_taxonomy(results: list[ValidationResult]) -> RiskTaxonomy:
 _SECURITY_CRITICAL_VALIDATORS = frozenset({"pii", "prompt_injection"})
 
 _BLOCKED_OVERRIDE_KEYS: dict[str, frozenset[str]] = {
-    "pii": frozenset({"pii_patterns_enabled"}),
-    "prompt_injection": frozenset(),
+    "forbidden_phrases": frozenset({"max_findings_per_validator"}),
+    "pii": frozenset({"pii_patterns_enabled", "max_findings_per_validator"}),
+    "prompt_injection": frozenset({"max_findings_per_validator"}),
 }
 
 
@@ -188,25 +224,203 @@ def _filter_overrides(
     return filtered
 
 
+def _is_fail_fast_hit(name: str, result: ValidationResult, settings: Settings) -> bool:
+    """True if *result* should stop the run under ``settings.fail_fast``."""
+    if name not in settings.fail_fast_validators:
+        return False
+    return any(f.severity == Severity.CRITICAL for f in result.findings)
+
+
+def _lowered_input(selected: list[tuple[str, BaseValidator]], text: str) -> str | None:
+    """Lower *text* once for every selected validator that scans it lowered.
+
+    The copy lives only as long as the run, so no request body outlives the
+    request that sent it.
+    """
+    if any(v.lowers_text for _, v in selected):
+        return lower_preserving_offsets(text)
+    return None
+
+
+def _run_validator(
+    name: str, validator: BaseValidator, text: str, lowered: str | None
+) -> tuple[ValidationResult, bool]:
+    """Run one validator, converting an unexpected exception into a failed result.
+
+    *lowered* is the run's :func:`_lowered_input` copy of *text*.
+
+    The flag is False when the validator raised or one of its guarded regex
+    scans timed out; such a result reflects the failure, not the text, and
+    must not be cached.
+    """
+    timeouts = regex_timeouts()
+    try:
+        if lowered is not None and validator.lowers_text:
+            result = validator.validate_lowered(text, lowered)
+        else:
+            result = validator.validate(text)
+    except Exception:
+        logger.exception("Validator '%s' raised an exception", name)
+        return ValidationResult(
+            validator_name=name,
+            passed=False,
+            findings=[],
+        ), False
+    return result, regex_timeouts() == timeouts
+
+
+async def _gather_validators(
+    selected: list[tuple[str, BaseValidator]],
+    text: str,
+    lowered: str | None,
+    executor: Executor,
+) -> list[tuple[ValidationResult, bool]]:
+    """Run *selected* concurrently and return their outcomes in order.
+
+    Validators go to *executor*, except that on the main thread (where a
+    server's event loop runs) those using the regex guard run inline while
+    the others proceed on the pool: the guard's SIGALRM timeout would not
+    fire on a worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    on_main = threading.current_thread() is threading.main_thread()
+    pooled = {
+        i: loop.run_in_executor(executor, _run_validator, name, v, text, lowered)
+        for i, (name, v) in enumerate(selected)
+        if not (on_main and v.uses_regex_guard)
+    }
+    outcomes = {
+        i: _run_validator(name, v, text, lowered)
+        for i, (name, v) in enumerate(selected)
+        if i not in pooled
+    }
+    outcomes.update(zip(pooled, await asyncio.gather(*pooled.values())))
+    return [outcomes[i] for i in range(len(selected))]
+
+
+class _ResultCache:
+    """Thread-safe LRU of validator results for previously seen inputs.
+
+    Keys use a BLAKE2 digest of the text rather than the text itself, so a
+    full cache does not pin up to ``maxsize`` request bodies in memory.
+    Results are stored as plain dumps and rebuilt on every hit: responses
+    are handed to callers who may keep or modify them, and that must not
+    leak into later hits. Rebuilding from a dump is several times cheaper
+    than ``model_copy(deep=True)``.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[bytes, tuple[str, ...]], list[dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str, names: tuple[str, ...]) -> tuple[bytes, tuple[str, ...]]:
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16)
+        return digest.digest(), names
+
+    def get(self, key: tuple[bytes, tuple[str, ...]]) -> list[ValidationResult] | None:
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                return None
+            self._entries.move_to_end(key)
+        return [ValidationResult.model_validate(r) for r in results]
+
+    def put(self, key: tuple[bytes, tuple[str, ...]], results: list[ValidationResult]) -> None:
+        stored = [r.model_dump() for r in results]
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+def _batch_items(request: BatchValidationRequest) -> list[ValidationRequest]:
+    """Split a batch into per-text requests.
+
+    The texts were already validated as part of the batch, so the items are
+    built with ``model_construct`` rather than checked again.
+    """
+    return [
+        ValidationRequest.model_construct(
+            text=text,
+            validators=request.validators,
+            config_overrides=request.config_overrides,
+        )
+        for text in request.texts
+    ]
+
+
+# Per-process engine used by ValidationEngine.validate_batch workers.
+_BATCH_WORKER: dict[str, ValidationEngine] = {}
+
+
+def _init_batch_worker(settings: Settings) -> None:
+    engine = ValidationEngine(settings=settings)
+    engine.warmup()
+    _BATCH_WORKER["engine"] = engine
+
+
+def _validate_in_worker(text: str, validators: list[str] | None) -> ValidationResponse:
+    return _BATCH_WORKER["engine"].validate_text(text, validators=validators)
+
+
 class ValidationEngine:
     """Runs a configurable set of validators against content."""
 
     def __init__(self, settings: Settings | None = None) -> None:
         self._settings = settings or get_settings()
+        self._config = self._settings_to_config()
         self._validators: dict[str, BaseValidator] = {}
-        self._build_validators()
-
-    def _build_validators(self) -> None:
-        config = self._settings_to_config()
-        for name, cls in _REGISTRY.items():
-            self._validators[name] = cls(config=config)
+        # Dedicated pool for run_async: one thread per validator at most, and
+        # not shared with the event loop's default executor.
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(_REGISTRY), thread_name_prefix="j7-validator"
+        )
+        # Worker processes for validate_batch, started on first use and kept
+        # so later batches skip process start-up and validator construction.
+        self._batch_pool: ProcessPoolExecutor | None = None
+        self._batch_pool_workers: int | None = None
+        self._batch_pool_lock = threading.Lock()
+        cache_size = self._settings.result_cache_size
+        self._result_cache = _ResultCache(cache_size) if cache_size > 0 else None
+
+    def __enter__(self) -> ValidationEngine:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the engine's validator threads and batch worker processes."""
+        self._executor.shutdown()
+        with self._batch_pool_lock:
+            if self._batch_pool is not None:
+                self._batch_pool.shutdown()
+                self._batch_pool = None
+
+    def _get_validator(self, name: str) -> BaseValidator:
+        """Return the shared validator for *name*, constructing it on first use."""
+        validator = self._validators.get(name)
+        if validator is None:
+            validator = _REGISTRY[name](config=self._config)
+            self._validators[name] = validator
+        return validator
+
+    def warmup(self) -> None:
+        """Construct every registered validator ahead of the request path."""
+        for name in _VALIDATOR_NAMES:
+            self._get_validator(name)
 
     def _settings_to_config(self) -> dict[str, Any]:
         return self._settings.model_dump()
 
     @property
     def available_validators(self) -> list[str]:
-        return list(self._validators.keys())
+        return list(_VALIDATOR_NAMES)
 
     def run(
         self,
@@ -214,59 +428,145 @@ class ValidationEngine:
         request_id: str | None = None,
     ) -> ValidationResponse:
         """Execute requested validators and return aggregated response."""
-        rid = request_id or uuid.uuid4().hex
+        rid = request_id or secrets.token_hex(16)
         clean_text = sanitize_input(request.text)
-        max_len = self._settings.max_text_length
-        if len(clean_text) > max_len:
-            return ValidationResponse(
-                request_id=rid,
-                version=__version__,
-                passed=False,
-                results=[
-                    ValidationResult(
-                        validator_name="_engine",
-                        passed=False,
-                        findings=[
-                            ValidationFinding(
-                                validator_name="_engine",
-                                severity=Severity.ERROR,
-                                message=(
-                                    f"Text length {len(clean_text):,} exceeds "
-                                    f"configured maximum of {max_len:,} characters."
-                                ),
-                            ),
-                        ],
-                    ),
-                ],
-                risk=RiskTaxonomy(
-                    composite_risk_score=100.0,
-                    risk_level="RED",
-                    axes=[],
-                ),
-                text_length=len(clean_text),
-                validators_run=0,
-            )
+        if len(clean_text) > self._settings.max_text_length:
+            return self._length_exceeded_response(rid, len(clean_text))
+
+        selected = self._select_validators(request)
+        cache_key = self._cache_key(request, clean_text, selected)
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return self._build_response(rid, clean_text, cached)
 
-        selected = self._resolve_validators(request.validators)
+        lowered = _lowered_input(selected, clean_text)
         results: list[ValidationResult] = []
+        complete = True
+
+        for name, validator in selected:
+            result, ok = _run_validator(name, validator, clean_text, lowered)
+            results.append(result)
+            complete = complete and ok
+            if self._should_stop(name, result):
+                logger.info(
+                    "Fail-fast: '%s' reported a CRITICAL finding — skipping %d validator(s)",
+                    name,
+                    len(selected) - len(results),
+                )
+                break
+
+        if cache_key is not None and complete:
+            self._result_cache.put(cache_key, results)
+        return self._build_response(rid, clean_text, results)
+
+    async def run_async(
+        self,
+        request: ValidationRequest,
+        request_id: str | None = None,
+    ) -> ValidationResponse:
+        """Async variant of :meth:`run` that executes validators concurrently.
+
+        Validators run on the engine's own thread pool (see
+        :func:`_gather_validators` for the regex-guarded exception) and
+        results keep the same order as the sequential path.  With
+        ``fail_fast`` enabled, the fail-fast validators run first as one
+        batch and the remainder only runs if none of them hit.
+        """
+        rid = request_id or secrets.token_hex(16)
+        clean_text = sanitize_input(request.text)
+        if len(clean_text) > self._settings.max_text_length:
+            return self._length_exceeded_response(rid, len(clean_text))
+
+        selected = self._select_validators(request)
+        cache_key = self._cache_key(request, clean_text, selected)
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return self._build_response(rid, clean_text, cached)
+
+        lowered = _lowered_input(selected, clean_text)
+        if self._settings.fail_fast:
+            priority = self._settings.fail_fast_validators
+            first = [(n, v) for n, v in selected if n in priority]
+            rest = [(n, v) for n, v in selected if n not in priority]
+            outcomes = await _gather_validators(first, clean_text, lowered, self._executor)
+            if not any(self._should_stop(r.validator_name, r) for r, _ in outcomes):
+                outcomes += await _gather_validators(rest, clean_text, lowered, self._executor)
+        else:
+            outcomes = await _gather_validators(selected, clean_text, lowered, self._executor)
+
+        results = [result for result, _ in outcomes]
+        if cache_key is not None and all(ok for _, ok in outcomes):
+            self._result_cache.put(cache_key, results)
+        return self._build_response(rid, clean_text, results)
+
+    async def run_batch_async(
+        self,
+        request: BatchValidationRequest,
+        request_id: str | None = None,
+    ) -> BatchValidationResponse:
+        """Run :meth:`run_async` on every text of *request*, in order.
+
+        Each text's validators are dispatched like a single request and
+        share the engine's pool with other requests rather than holding a
+        thread for the whole batch. Item ``i`` gets the request ID
+        ``"<request_id>-<i>"``.
+        """
+        rid = request_id or secrets.token_hex(16)
+        responses = [
+            await self.run_async(item, request_id=f"{rid}-{i}")
+            for i, item in enumerate(_batch_items(request))
+        ]
+        return BatchValidationResponse(
+            request_id=rid,
+            passed=all(r.passed for r in responses),
+            results=responses,
+        )
 
-        for name in selected:
-            validator = self._validators[name]
+    def _select_validators(
+        self, request: ValidationRequest
+    ) -> list[tuple[str, BaseValidator]]:
+        """Resolve the requested names to validator instances, applying overrides."""
+        names = self._resolve_validators(request.validators)
+        if self._settings.fail_fast:
+            names = self._fail_fast_order(names)
+
+        selected: list[tuple[str, BaseValidator]] = []
+        for name in names:
             if name in request.config_overrides:
                 safe_overrides = _filter_overrides(name, request.config_overrides[name])
-                merged = {**self._settings_to_config(), **safe_overrides}
+                merged = {**self._config, **safe_overrides}
                 validator = _REGISTRY[name](config=merged)
-            try:
-                result = validator.validate(clean_text)
-            except Exception:
-                logger.exception("Validator '%s' raised an exception", name)
-                result = ValidationResult(
-                    validator_name=name,
-                    passed=False,
-                    findings=[],
-                )
-            results.append(result)
+            else:
+                validator = self._get_validator(name)
+            selected.append((name, validator))
+        return selected
 
+    def _cache_key(
+        self,
+        request: ValidationRequest,
+        clean_text: str,
+        selected: list[tuple[str, BaseValidator]],
+    ) -> tuple[bytes, tuple[str, ...]] | None:
+        """Return the result-cache key for this run, or None if it must not be cached.
+
+        Runs with per-request config overrides use one-off validators and
+        are never cached.
+        """
+        if self._result_cache is None or request.config_overrides:
+            return None
+        return _ResultCache.key(clean_text, tuple(name for name, _ in selected))
+
+    def _should_stop(self, name: str, result: ValidationResult) -> bool:
+        return self._settings.fail_fast and _is_fail_fast_hit(name, result, self._settings)
+
+    def _build_response(
+        self,
+        rid: str,
+        clean_text: str,
+        results: list[ValidationResult],
+    ) -> ValidationResponse:
         all_passed = bool(results) and all(r.passed for r in results)
         risk = compute_risk_taxonomy(results)
 
@@ -280,6 +580,37 @@ class ValidationEngine:
             validators_run=len(results),
         )
 
+    def _length_exceeded_response(self, rid: str, text_length: int) -> ValidationResponse:
+        max_len = self._settings.max_text_length
+        return ValidationResponse(
+            request_id=rid,
+            version=__version__,
+            passed=False,
+            results=[
+                ValidationResult(
+                    validator_name="_engine",
+                    passed=False,
+                    findings=[
+                        ValidationFinding(
+                            validator_name="_engine",
+                            severity=Severity.ERROR,
+                            message=(
+                                f"Text length {text_length:,} exceeds "
+                                f"configured maximum of {max_len:,} characters."
+                            ),
+                        ),
+                    ],
+                ),
+            ],
+            risk=RiskTaxonomy(
+                composite_risk_score=100.0,
+                risk_level="RED",
+                axes=[],
+            ),
+            text_length=text_length,
+            validators_run=0,
+        )
+
     def validate_text(
         self,
         text: str,
@@ -293,13 +624,54 @@ class ValidationEngine:
         )
         return self.run(request, request_id=request_id)
 
+    def validate_batch(
+        self,
+        texts: list[str],
+        validators: list[str] | None = None,
+        max_workers: int | None = None,
+    ) -> list[ValidationResponse]:
+        """Validate independent documents in parallel worker processes.
+
+        The validators are pure-Python and hold the GIL, so documents are
+        spread across processes rather than threads. Each worker builds its
+        own engine from this engine's settings once, and the pool is kept
+        for later calls until :meth:`close`. Responses come back in the
+        order of *texts*. With fewer than two texts, or ``max_workers=1``,
+        everything runs in this process.
+        """
+        if len(texts) < 2 or max_workers == 1:
+            return [self.validate_text(t, validators=validators) for t in texts]
+        pool = self._get_batch_pool(max_workers)
+        return list(pool.map(_validate_in_worker, texts, [validators] * len(texts)))
+
+    def _get_batch_pool(self, max_workers: int | None) -> ProcessPoolExecutor:
+        """Return the batch worker pool, starting it on first use.
+
+        A call asking for a different *max_workers* replaces the pool.
+        """
+        with self._batch_pool_lock:
+            if self._batch_pool is None or self._batch_pool_workers != max_workers:
+                if self._batch_pool is not None:
+                    self._batch_pool.shutdown(wait=False)
+                self._batch_pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_batch_worker,
+                    initargs=(self._settings,),
+                )
+                self._batch_pool_workers = max_workers
+            return self._batch_pool
+
+    def _fail_fast_order(self, selected: list[str]) -> list[str]:
+        """Move fail-fast validators to the front so they can short-circuit the rest."""
+        priority = self._settings.fail_fast_validators
+        return sorted(selected, key=lambda n: n not in priority)
+
     def _resolve_validators(self, names: list[str]) -> list[str]:
-        if "all" in names:
-            return list(self._validators.keys())
-        resolved = []
-        for n in names:
-            if n in self._validators:
-                resolved.append(n)
-            else:
-                logger.warning("Unknown validator requested: '%s' — skipping", n)
-        return resolved
+        """Map requested names to known validators, preserving order and dropping repeats."""
+        requested = dict.fromkeys(names)
+        if "all" in requested:
+            return list(_VALIDATOR_NAMES)
+        unknown = requested.keys() - _REGISTRY.keys()
+        if unknown:
+            logger.warning("Unknown validator(s) requested: %s — skipping", sorted(unknown))
+        return [sys.intern(n) for n in requested if n not in unknown]
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
-import uuid
+import secrets
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
-
-from pydantic import BaseModel, Field
+from typing import Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = [
+    "MAX_BATCH_SIZE",
+    "MAX_TEXT_LENGTH",
+    "BatchValidationRequest",
+    "BatchValidationResponse",
+    "RiskAxis",
+    "RiskTaxonomy",
+    "Severity",
+    "ValidationFinding",
+    "ValidationRequest",
+    "ValidationResponse",
+    "ValidationResult",
+]
 
 MAX_TEXT_LENGTH = 500_000
+MAX_BATCH_SIZE = 100
 
 
 class Severity(str, Enum):
@@ -65,9 +80,30 @@ class ValidationRequest(BaseModel):
     )
 
 
+class BatchValidationRequest(BaseModel):
+    """Inbound request to validate several texts with the same settings."""
+
+    texts: list[Annotated[str, Field(min_length=1, max_length=MAX_TEXT_LENGTH)]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description=f"Contents to validate (1-{MAX_BATCH_SIZE} items).",
+    )
+    validators: list[str] = Field(
+        default=["all"],
+        description='List of validator names to run on every text, or ["all"].',
+    )
+    config_overrides: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Per-request config overrides keyed by validator name.",
+    )
+
+
 class RiskAxis(BaseModel):
     """Score for a single axis of the RISK_TAXONOMY_v0."""
 
+    model_config = ConfigDict(frozen=True)
+
     axis: str
     label: str
     weight: float
@@ -95,7 +131,7 @@ class ValidationResponse(BaseModel):
     """Outbound response from the validation engine."""
 
     request_id: str = Field(
-        default_factory=lambda: uuid.uuid4().hex,
+        default_factory=lambda: secrets.token_hex(16),
         description="Unique identifier for this validation run.",
     )
     timestamp: str = Field(
@@ -108,3 +144,22 @@ class ValidationResponse(BaseModel):
     risk: RiskTaxonomy = Field(default_factory=RiskTaxonomy)
     text_length: int = 0
     validators_run: int = 0
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes with pydantic-core's native encoder."""
+        return self.__pydantic_serializer__.to_json(self)
+
+
+class BatchValidationResponse(BaseModel):
+    """Outbound response for a batch, with one response per input text."""
+
+    request_id: str = Field(
+        default_factory=lambda: secrets.token_hex(16),
+        description="Identifier of the batch; item IDs are '<request_id>-<index>'.",
+    )
+    passed: bool = Field(description="True only if every text passed.")
+    results: list[ValidationResponse] = Field(default_factory=list)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes with pydantic-core's native encoder."""
+        return self.__pydantic_serializer__.to_json(self)
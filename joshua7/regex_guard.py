@@ -2,38 +2,64 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 import re
 import signal
 import threading
+from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
 _REGEX_TIMEOUT_SECONDS = 2
 
+# Per-thread count of aborted scans, so a caller can tell an empty result
+# from one cut short by the timeout.
+_timeouts = threading.local()
+
 
 def _is_main_thread() -> bool:
     return threading.current_thread() is threading.main_thread()
 
 
+def regex_timeouts() -> int:
+    """Return how many guarded scans have timed out on the current thread."""
+    return getattr(_timeouts, "count", 0)
+
+
+def _collect(
+    pattern: re.Pattern[str],
+    text: str,
+    accept: Callable[[re.Match[str]], bool] | None,
+    limit: int | None,
+) -> list[re.Match[str]]:
+    matches = pattern.finditer(text)
+    if accept is not None:
+        matches = filter(accept, matches)
+    return list(itertools.islice(matches, limit))
+
+
 def safe_finditer(
     pattern: re.Pattern[str],
     text: str,
     *,
     timeout: int = _REGEX_TIMEOUT_SECONDS,
+    accept: Callable[[re.Match[str]], bool] | None = None,
+    limit: int | None = None,
 ) -> list[re.Match[str]]:
     """Run ``pattern.finditer(text)`` with a wall-clock timeout.
 
-    Returns a (possibly empty) list of matches. If the regex exceeds
-    *timeout* seconds the operation is aborted and an empty list is
-    returned — the caller should treat this as a failed-open condition
-    and log accordingly.
+    Returns a (possibly empty) list of matches. Only matches *accept*
+    returns True for are kept, and the scan stops once *limit* have been
+    kept. If the regex exceeds *timeout* seconds the operation is aborted
+    and an empty list is returned — the caller should treat this as a
+    failed-open condition and log accordingly.
 
     On platforms/threads where ``signal.alarm`` is unavailable we fall
     back to an unguarded call (better to run than to silently skip).
     """
     if not _is_main_thread():
-        return list(pattern.finditer(text))
+        return _collect(pattern, text, accept, limit)
 
     try:
         old_handler = signal.getsignal(signal.SIGALRM)
@@ -44,12 +70,13 @@ def safe_finditer(
         signal.signal(signal.SIGALRM, _alarm_handler)
         signal.alarm(timeout)
         try:
-            matches = list(pattern.finditer(text))
+            matches = _collect(pattern, text, accept, limit)
         finally:
             signal.alarm(0)
             signal.signal(signal.SIGALRM, old_handler)
         return matches
     except TimeoutError:
+        _timeouts.count = regex_timeouts() + 1
         logger.warning(
             "Regex timed out after %ds on pattern %s (text length %d)",
             timeout,
@@ -58,4 +85,4 @@ def safe_finditer(
         )
         return []
     except (AttributeError, OSError):
-        return list(pattern.finditer(text))
+        return _collect(pattern, text, accept, limit)
@@ -54,7 +54,7 @@ _HOMOGLYPH_RE = re.compile("|".join(re.escape(k) for k in _HOMOGLYPH_MAP))
 
 
 def _replace_homoglyphs(text: str) -> str:
-    return _HOMOGLYPH_RE.sub(lambda m: _HOMOGLYPH_MAP[m.group()], text)
+    return _HOMOGLYPH_RE.sub(lambda m: _HOMOGLYPH_MAP[m[0]], text)
 
 
 def sanitize_input(text: str) -> str:
@@ -73,3 +73,30 @@ def sanitize_input(text: str) -> str:
     text = _CONTROL_CHARS.sub("", text)
     text = _replace_homoglyphs(text)
     return text
+
+
+# Non-ASCII letters that ``re.IGNORECASE`` treats as equal to ASCII letters
+# but that ``str.lower`` does not map to them. U+0130 (İ) is also the only
+# code point whose full lowercase is two characters, which would shift
+# offsets. U+212A (Kelvin sign) already lowers to "k".
+_IGNORECASE_FOLDS = (
+    ("\u0130", "i"),  # Latin capital I with dot above
+    ("\u0131", "i"),  # Latin small dotless i
+    ("\u017f", "s"),  # Latin small long s
+)
+
+
+def lower_preserving_offsets(text: str) -> str:
+    """Lowercase *text* the way ``re.IGNORECASE`` compares ASCII letters.
+
+    ``len(result) == len(text)`` always holds, so spans found in the
+    lowered copy can be reported against the original.
+    """
+    if not text.isascii():
+        # str.translate does a mapping lookup per character; a containment
+        # check per fold is a plain scan and almost always finds nothing.
+        for char, folded in _IGNORECASE_FOLDS:
+            if char in text:
+                text = text.replace(char, folded)
+    return text.lower()
+
@@ -12,13 +12,31 @@ class BaseValidator(ABC):
     """Every validator must subclass this and implement ``validate``."""
 
     name: str = "base"
+    # True for validators that scan with ``safe_finditer``. Its timeout relies
+    # on SIGALRM, which only fires on the main thread, so the engine keeps
+    # these off its worker threads when it can.
+    uses_regex_guard: bool = False
+    # True for validators that scan ``lower_preserving_offsets(text)``. The
+    # engine lowers each input once per run and hands the copy to all of
+    # them through ``validate_lowered``.
+    lowers_text: bool = False
 
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         self.config: dict[str, Any] = config or {}
+        # None when uncapped, so ``hits[:self._max_findings]`` keeps everything.
+        self._max_findings: int | None = self.config.get("max_findings_per_validator") or None
 
     @abstractmethod
     def validate(self, text: str) -> ValidationResult:
         """Run the validator against *text* and return a result."""
 
+    def validate_lowered(self, text: str, lowered: str) -> ValidationResult:
+        """Like :meth:`validate`, given ``lower_preserving_offsets(text)`` as *lowered*.
+
+        Validators that set ``lowers_text`` override this and scan *lowered*
+        instead of lowering *text* themselves; the rest ignore it.
+        """
+        return self.validate(text)
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}>"
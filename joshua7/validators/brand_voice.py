@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import Any
 
 from joshua7.models import Severity, ValidationFinding, ValidationResult
+from joshua7.sanitize import lower_preserving_offsets
 from joshua7.validators.base import BaseValidator
 
 logger = logging.getLogger(__name__)
@@ -22,48 +24,86 @@ _TONE_PENALTY_WORDS: dict[str, list[str]] = {
     ],
 }
 
-_POSITIVE_SIGNALS = [
-    re.compile(r"\b(?:we|our|us)\b", re.IGNORECASE),
-    re.compile(r"\b(?:you|your)\b", re.IGNORECASE),
-]
+# First- and second-person pronouns, matched against lowered text. The
+# leading class lets the regex engine skip ahead to candidate letters
+# instead of trying the alternation at every position.
+_POSITIVE_SIGNAL = re.compile(r"(?=[ouwy])\b(?:we|our|us|you|your)\b")
 
 
-def _build_word_patterns(words: list[str]) -> list[tuple[str, re.Pattern[str]]]:
-    """Build word-boundary regex patterns to avoid substring false positives."""
-    pairs = []
-    for w in words:
-        if " " in w:
-            pat = re.compile(re.escape(w), re.IGNORECASE)
-        else:
-            pat = re.compile(rf"\b{re.escape(w)}\b", re.IGNORECASE)
-        pairs.append((w, pat))
-    return pairs
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _at_word_boundary(text: str, pos: int) -> bool:
+    """Mirror regex ``\\b`` at *pos*: exactly one side is a word character."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _find_term(text: str, term: str, start: int, bounded: bool) -> int:
+    """Return the next index >= *start* where *term* occurs, or -1.
+
+    With *bounded*, only occurrences delimited by word boundaries count,
+    so "bro" is not found inside "broken".
+    """
+    i = text.find(term, start)
+    if not bounded:
+        return i
+    end_offset = len(term)
+    while i != -1 and not (
+        _at_word_boundary(text, i) and _at_word_boundary(text, i + end_offset)
+    ):
+        i = text.find(term, i + 1)
+    return i
+
+
+def _count_term(text: str, term: str, bounded: bool) -> int:
+    """Count non-overlapping occurrences of *term* in *text*."""
+    count = 0
+    i = _find_term(text, term, 0, bounded)
+    while i != -1:
+        count += 1
+        i = _find_term(text, term, i + len(term), bounded)
+    return count
+
+
+@functools.lru_cache(maxsize=32)
+def _build_penalty_terms(words: tuple[str, ...]) -> tuple[tuple[str, bool], ...]:
+    """Pair each penalty word with whether it needs word-boundary matching.
+
+    Single words are boundary-matched to avoid substring false positives;
+    multi-word phrases are matched as plain substrings.
+    """
+    return tuple((w, " " not in w) for w in words)
 
 
 class BrandVoiceScorer(BaseValidator):
     """Score content against a target tone and keyword list."""
 
     name = "brand_voice"
+    lowers_text = True
 
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         super().__init__(config)
         self._target_score = self.config.get("brand_voice_target_score", 60.0)
-        self._keywords = [k.lower() for k in self.config.get("brand_voice_keywords", [])]
+        self._keywords = [
+            lower_preserving_offsets(k) for k in self.config.get("brand_voice_keywords", [])
+        ]
         self._tone = self.config.get("brand_voice_tone", "professional")
         raw_words = _TONE_PENALTY_WORDS.get(self._tone, [])
-        self._penalty_patterns = _build_word_patterns(raw_words)
+        self._penalty_terms = _build_penalty_terms(tuple(raw_words))
 
     def validate(self, text: str) -> ValidationResult:
+        return self.validate_lowered(text, lower_preserving_offsets(text))
+
+    def validate_lowered(self, text: str, lowered: str) -> ValidationResult:
         findings: list[ValidationFinding] = []
         score = 70.0
 
-        words = text.split()
-        word_count = max(len(words), 1)
-
         penalty_count = 0
-        for pw, pattern in self._penalty_patterns:
-            matches = pattern.findall(text)
-            occurrences = len(matches)
+        for pw, bounded in self._penalty_terms:
+            occurrences = _count_term(lowered, pw, bounded)
             if occurrences > 0:
                 penalty_count += occurrences
                 findings.append(
@@ -80,16 +120,18 @@ class BrandVoiceScorer(BaseValidator):
         if self._keywords:
             keyword_hits = sum(
                 1 for kw in self._keywords
-                if re.search(rf"\b{re.escape(kw)}\b", text, re.IGNORECASE)
+                if _find_term(lowered, kw, 0, bounded=True) != -1
             )
             keyword_ratio = keyword_hits / len(self._keywords)
             score += keyword_ratio * 15.0
 
-        signal_hits = 0
-        for pattern in _POSITIVE_SIGNALS:
-            signal_hits += len(pattern.findall(text))
-        engagement_ratio = min(signal_hits / word_count, 0.15)
-        score += engagement_ratio * 100.0
+        signal_hits = len(_POSITIVE_SIGNAL.findall(lowered))
+        if signal_hits:
+            # Only the count is needed, and only when there is something to
+            # divide; str.split remains the cheapest exact whitespace count.
+            word_count = max(len(text.split()), 1)
+            engagement_ratio = min(signal_hits / word_count, 0.15)
+            score += engagement_ratio * 100.0
 
         score = max(0.0, min(100.0, score))
         passed = score >= self._target_score
@@ -2,43 +2,133 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-import re
+from collections.abc import Iterator
 from typing import Any
 
 from joshua7.config import _DEFAULT_FORBIDDEN_PHRASES
 from joshua7.models import Severity, ValidationFinding, ValidationResult
-from joshua7.regex_guard import safe_finditer
+from joshua7.sanitize import lower_preserving_offsets
 from joshua7.validators.base import BaseValidator
 
+try:
+    import ahocorasick
+except ImportError:  # optional: pip install joshua7[fast]
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Below this many phrases, one str.find pass per phrase beats walking an
+# Aho-Corasick automaton (measured on 110 KB of text: 1.5 vs 2.1 ms at 16
+# phrases, 2.8 vs 2.7 ms at 32, 44 vs 4 ms at 500).
+_AUTOMATON_MIN_PHRASES = 32
+
+
+def _build_automaton(phrases: list[str]) -> Any:
+    """Return an Aho-Corasick automaton over *phrases*, or ``None``.
+
+    ``None`` means *phrases* are few enough for :func:`_find_phrases` to
+    scan them one by one, or that ``pyahocorasick`` is not installed.
+    """
+    if ahocorasick is None or len(phrases) < _AUTOMATON_MIN_PHRASES:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+def _occurrences(text: str, phrase: str) -> Iterator[tuple[int, int, str]]:
+    """Yield ``(start, -len(phrase), phrase)`` for each occurrence, left to right."""
+    i = text.find(phrase)
+    while i != -1:
+        yield i, -len(phrase), phrase
+        i = text.find(phrase, i + 1)
+
+
+def _automaton_occurrences(
+    text: str, automaton: Any, longest: int
+) -> Iterator[tuple[int, int, str]]:
+    """Yield the automaton's occurrences ordered by start, longest first.
+
+    The automaton reports occurrences by end position. Once the scan has
+    reached *end*, nothing still to come can start at or before
+    ``end - longest``, so anything pending up to there is released.
+    """
+    pending: list[tuple[int, int, str]] = []
+    for end, phrase in automaton.iter(text):
+        heapq.heappush(pending, (end - len(phrase) + 1, -len(phrase), phrase))
+        while pending[0][0] <= end - longest:
+            yield heapq.heappop(pending)
+    while pending:
+        yield heapq.heappop(pending)
+
+
+def _find_phrases(
+    text: str, phrases: list[str], automaton: Any = None, limit: int | None = None
+) -> list[tuple[int, str]]:
+    """Return ``(start, phrase)`` for each occurrence of *phrases* in *text*.
+
+    Occurrences are chosen leftmost-longest and never overlap, matching a
+    scan with a longest-first alternation. Every phrase is located with
+    ``str.find``, which skips through the text far faster than the regex
+    engine can try each position. With an *automaton* from
+    :func:`_build_automaton`, all phrases are instead found in one pass over
+    the text. Occurrences are produced lazily in order, so the scan stops
+    once *limit* have been kept.
+    """
+    candidates: Iterator[tuple[int, int, str]]
+    if automaton is not None:
+        candidates = _automaton_occurrences(text, automaton, max(map(len, phrases)))
+    else:
+        candidates = heapq.merge(*(_occurrences(text, phrase) for phrase in phrases))
+
+    hits: list[tuple[int, str]] = []
+    last_end = 0
+    for start, neg_len, phrase in candidates:
+        if start >= last_end:
+            hits.append((start, phrase))
+            if len(hits) == limit:
+                break
+            last_end = start - neg_len
+    return hits
+
 
 class ForbiddenPhraseDetector(BaseValidator):
     """Scan content for forbidden/banned phrases."""
 
     name = "forbidden_phrases"
+    lowers_text = True
 
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         super().__init__(config)
         phrases = self.config.get("forbidden_phrases", _DEFAULT_FORBIDDEN_PHRASES)
-        self._phrases = [p.lower() for p in phrases]
-        self._patterns = [re.compile(re.escape(p), re.IGNORECASE) for p in self._phrases]
+        self._phrases = list(dict.fromkeys(lower_preserving_offsets(p) for p in phrases if p))
+        self._automaton = _build_automaton(self._phrases)
+        # One message string per phrase, shared by all of its findings.
+        self._messages = {p: f"Forbidden phrase detected: '{p}'" for p in self._phrases}
 
     def validate(self, text: str) -> ValidationResult:
+        return self.validate_lowered(text, lower_preserving_offsets(text))
+
+    def validate_lowered(self, text: str, lowered: str) -> ValidationResult:
         findings: list[ValidationFinding] = []
 
-        for pattern, phrase in zip(self._patterns, self._phrases):
-            for match in safe_finditer(pattern, text):
-                findings.append(
-                    ValidationFinding(
-                        validator_name=self.name,
-                        severity=Severity.ERROR,
-                        message=f"Forbidden phrase detected: '{phrase}'",
-                        span=(match.start(), match.end()),
-                        metadata={"phrase": phrase},
-                    )
+        if self._phrases:
+            findings = [
+                ValidationFinding(
+                    validator_name=self.name,
+                    severity=Severity.ERROR,
+                    message=self._messages[phrase],
+                    span=(start, start + len(phrase)),
+                    metadata={"phrase": phrase},
+                )
+                for start, phrase in _find_phrases(
+                    lowered, self._phrases, self._automaton, self._max_findings
                 )
+            ]
 
         return ValidationResult(
             validator_name=self.name,
@@ -1,9 +1,12 @@
-"""PII Validator — detects emails, phone numbers, and SSNs."""
+"""PII Validator — detects emails, phone numbers, SSNs, and card numbers."""
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+import string
+from collections.abc import Callable
 from typing import Any
 
 from joshua7.models import Severity, ValidationFinding, ValidationResult
@@ -12,10 +15,8 @@ from joshua7.validators.base import BaseValidator
 
 logger = logging.getLogger(__name__)
 
+# Emails are found by _scan_emails rather than a regex; see below.
 _PII_PATTERNS: dict[str, re.Pattern[str]] = {
-    "email": re.compile(
-        r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}",
-    ),
     "phone": re.compile(
         r"(?<!\d)"
         r"(?:\+?1[\s\-.]?)?"
@@ -38,6 +39,8 @@ _PII_PATTERNS: dict[str, re.Pattern[str]] = {
     ),
 }
 
+_PII_TYPES: tuple[str, ...] = ("email", *_PII_PATTERNS)
+
 _REDACT_MAP: dict[str, str] = {
     "email": "***@***.***",
     "phone": "***-***-****",
@@ -46,41 +49,220 @@ _REDACT_MAP: dict[str, str] = {
 }
 
 
+# Every phone/SSN/card match starts with a digit, "(" or "+". Checking this
+# first lets the combined scan skip ordinary word positions without trying
+# each alternative.
+_PII_START_GATE = r"(?=[\d(+])"
+
+_ANY_DIGIT = re.compile(r"\d")
+
+
+def _has_digit(text: str) -> bool:
+    """Return True if *text* has a character ``\\d`` matches.
+
+    Phone, SSN and card matches all contain digits, so text without any can
+    skip the combined scan. Ten substring checks are far cheaper than a
+    regex pass; the regex is only needed for non-ASCII digits.
+    """
+    if any(d in text for d in string.digits):
+        return True
+    return not text.isascii() and _ANY_DIGIT.search(text) is not None
+
+
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+
+def _email_end(text: str, at: int) -> int:
+    r"""Return where an email whose "@" is at *at* ends, or -1 if it cannot.
+
+    Matches ``@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}`` the way the regex would: the
+    rightmost "." in the domain run followed by two or more letters wins.
+    """
+    run_end = at + 1
+    while run_end < len(text) and text[run_end] in _EMAIL_DOMAIN_CHARS:
+        run_end += 1
+    dot = text.rfind(".", at + 2, run_end)
+    while dot != -1:
+        end = dot + 1
+        while end < run_end and text[end] in _ASCII_LETTERS:
+            end += 1
+        if end - dot > 2:
+            return end
+        dot = text.rfind(".", at + 2, dot)
+    return -1
+
+
+def _scan_emails(text: str, limit: int | None = None) -> list[tuple[int, int]]:
+    r"""Return spans of ``[a-zA-Z0-9._%+\-]+@domain.tld`` emails in *text*.
+
+    Each "@" is located with ``str.find`` and the match is grown outwards
+    from it, so text without "@" costs a single scan and no regex work.
+    The scan stops once *limit* emails have been found.
+    """
+    spans: list[tuple[int, int]] = []
+    floor = 0
+    at = text.find("@")
+    while at != -1 and len(spans) != limit:
+        start = at
+        while start > floor and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+        if start < at:
+            end = _email_end(text, at)
+            if end != -1:
+                spans.append((start, end))
+                floor = end
+        at = text.find("@", at + 1)
+    return spans
+
+
+def _resolve_overlaps(text: str, hits: list[tuple[int, int, str]]) -> list[tuple[int, int, str]]:
+    """Keep hits left to right as one combined scan would, dropping overlaps.
+
+    Ties go to the earlier entry (emails are listed first). An email whose
+    local part overlaps the previous hit is trimmed to start after it, as a
+    regex resuming at that point would still match from there to the "@".
+    """
+    kept: list[tuple[int, int, str]] = []
+    last_end = 0
+    for start, end, pii_type in sorted(hits, key=lambda h: h[0]):
+        if start < last_end and pii_type == "email" and last_end < text.find("@", start, end):
+            start = last_end
+        if start >= last_end:
+            kept.append((start, end, pii_type))
+            last_end = end
+    return kept
+
+
+@functools.lru_cache(maxsize=32)
+def _combine_patterns(pii_types: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Join the patterns for *pii_types* into one alternation with named groups.
+
+    A single ``finditer`` then walks the text once and ``match.lastgroup``
+    identifies which type matched.
+    """
+    if not pii_types:
+        return None
+    alternation = "|".join(
+        f"(?P<{name}>{_PII_PATTERNS[name].pattern})" for name in pii_types
+    )
+    return re.compile(f"{_PII_START_GATE}(?:{alternation})")
+
+
+# Luhn doubling step for each digit: 2*d, minus 9 when that exceeds 9.
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def _valid_ssn(candidate: str) -> bool:
+    """Reject SSNs the SSA never issues: area 000/666/9xx, group 00, serial 0000."""
+    area, group, serial = int(candidate[:3]), int(candidate[4:6]), int(candidate[7:])
+    return area not in (0, 666) and area < 900 and group != 0 and serial != 0
+
+
+def _valid_card(candidate: str) -> bool:
+    """Return True when the card number's digits pass the Luhn checksum."""
+    digits = [int(c) for c in candidate if c.isdecimal()]
+    total = sum(digits[-1::-2]) + sum(_LUHN_DOUBLED[d] for d in digits[-2::-2])
+    return total % 10 == 0
+
+
+# Post-match checks that weed out numbers which are shaped like, but cannot
+# be, real identifiers. Done in Python so the patterns stay lookahead-free.
+_PII_CHECKS: dict[str, Callable[[str], bool]] = {
+    "ssn": _valid_ssn,
+    "credit_card": _valid_card,
+}
+
+
+def _passes_checks(match: re.Match[str]) -> bool:
+    check = _PII_CHECKS.get(match.lastgroup)
+    return check is None or check(match[0])
+
+
 def _redact(pii_type: str) -> str:
     """Return a fixed redacted placeholder — never echo real PII."""
     return _REDACT_MAP.get(pii_type, "***REDACTED***")
 
 
+# Message and metadata for each type's findings, formatted once at import.
+# Pydantic copies the metadata dict into each finding, so sharing is safe.
+_FINDING_MESSAGES: dict[str, str] = {
+    pii_type: f"Potential {pii_type.upper()} detected (redacted: {_redact(pii_type)})"
+    for pii_type in _PII_TYPES
+}
+_FINDING_METADATA: dict[str, dict[str, str]] = {
+    pii_type: {"pii_type": pii_type, "redacted": _redact(pii_type)} for pii_type in _PII_TYPES
+}
+
+
 class PIIValidator(BaseValidator):
     """Detect personally identifiable information in content."""
 
     name = "pii"
+    uses_regex_guard = True
 
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         super().__init__(config)
-        enabled = self.config.get("pii_patterns_enabled", list(_PII_PATTERNS.keys()))
-        self._active: dict[str, re.Pattern[str]] = {
-            k: v for k, v in _PII_PATTERNS.items() if k in enabled
-        }
+        enabled = set(self.config.get("pii_patterns_enabled", _PII_TYPES))
+        self._scan_email = "email" in enabled
+        self._active: tuple[str, ...] = tuple(k for k in _PII_PATTERNS if k in enabled)
+        self._combined = _combine_patterns(self._active)
+
+    def _scan_numbers(self, text: str, limit: int | None) -> list[tuple[int, int, str]]:
+        return [
+            (*match.span(), match.lastgroup)
+            for match in safe_finditer(
+                self._combined, text, accept=_passes_checks, limit=limit
+            )
+        ]
+
+    def _scan_all(self, text: str, limit: int | None) -> list[tuple[int, int, str]]:
+        """Return the first *limit* email and number hits, overlaps resolved.
+
+        Each scan fetches one hit past *n*. Overlaps resolve left to right,
+        so every kept hit starting before the first one left out is final;
+        if fewer than *limit* are, *n* doubles and both scans run again.
+        """
+        n = limit
+        while True:
+            fetch = None if n is None else n + 1
+            emails = [(start, end, "email") for start, end in _scan_emails(text, fetch)]
+            numbers = self._scan_numbers(text, fetch)
+            hits = _resolve_overlaps(text, emails[:n] + numbers[:n])
+            cut = [found[n][0] for found in (emails, numbers) if n is not None and len(found) > n]
+            if cut:
+                hits = [hit for hit in hits if hit[0] < min(cut)]
+            if not cut or len(hits) >= limit:
+                return hits[:limit]
+            n *= 2
 
     def validate(self, text: str) -> ValidationResult:
-        findings: list[ValidationFinding] = []
-
-        for pii_type, pattern in self._active.items():
-            for match in safe_finditer(pattern, text):
-                redacted = _redact(pii_type)
-                findings.append(
-                    ValidationFinding(
-                        validator_name=self.name,
-                        severity=Severity.CRITICAL,
-                        message=f"Potential {pii_type.upper()} detected (redacted: {redacted})",
-                        span=(match.start(), match.end()),
-                        metadata={"pii_type": pii_type, "redacted": redacted},
-                    )
-                )
+        # Each scan stops at the findings cap rather than collecting
+        # everything and slicing.
+        cap = self._max_findings
+        hits: list[tuple[int, int, str]] = []
+        if self._combined is None or not _has_digit(text):
+            if self._scan_email:
+                hits = [(start, end, "email") for start, end in _scan_emails(text, cap)]
+        elif self._scan_email:
+            hits = self._scan_all(text, cap)
+        else:
+            hits = self._scan_numbers(text, cap)
+
+        findings = [
+            ValidationFinding(
+                validator_name=self.name,
+                severity=Severity.CRITICAL,
+                message=_FINDING_MESSAGES[pii_type],
+                span=(start, end),
+                metadata=_FINDING_METADATA[pii_type],
+            )
+            for start, end, pii_type in hits
+        ]
 
         return ValidationResult(
             validator_name=self.name,
-            passed=len(findings) == 0,
+            passed=not hits,
             findings=findings,
         )
@@ -4,78 +4,206 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Callable
+from typing import Any
 
 from joshua7.models import Severity, ValidationFinding, ValidationResult
 from joshua7.regex_guard import safe_finditer
+from joshua7.sanitize import lower_preserving_offsets
 from joshua7.validators.base import BaseValidator
 
 logger = logging.getLogger(__name__)
 
-_INJECTION_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+# Patterns are written in lowercase and run case-sensitively over
+# ``lower_preserving_offsets(text)``, which gives the same matches as
+# ``re.IGNORECASE`` on the original at a fraction of the cost; spans carry
+# over unchanged because lowering preserves length.
+_INJECTION_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
     ("ignore_instructions", re.compile(
         r"ignore\s+(all\s+)?(previous|prior|above)\s+(instructions?|prompts?|rules?)",
-        re.IGNORECASE,
     )),
     ("system_prompt_leak", re.compile(
         r"(show|reveal|print|output|repeat)\s+(your\s+)?(system\s+prompt|instructions|rules)",
-        re.IGNORECASE,
     )),
     ("role_override", re.compile(
-        r"you\s+are\s+now\s+(?:a\s+)?(?:DAN|unrestricted|jailbroken|evil)",
-        re.IGNORECASE,
+        r"you\s+are\s+now\s+(?:a\s+)?(?:dan|unrestricted|jailbroken|evil)",
     )),
     ("delimiter_injection", re.compile(
         r"```\s*(system|assistant|user)\s*\n",
-        re.IGNORECASE,
     )),
     ("encoded_injection", re.compile(
         r"(?:base64|rot13|hex)\s*(?:decode|encode)\s*[:=]",
-        re.IGNORECASE,
     )),
     ("do_anything_now", re.compile(
-        r"(?:DAN|do\s+anything\s+now)\s+mode",
-        re.IGNORECASE,
+        r"(?:dan|do\s+anything\s+now)\s+mode",
     )),
     ("instruction_override", re.compile(
         r"(?:new|updated?|override)\s+(?:system\s+)?(?:instructions?|prompt|rules?)\s*[:=]",
-        re.IGNORECASE,
     )),
     ("hidden_text", re.compile(
         r"<\s*(?:hidden|invisible|secret)\s*>",
-        re.IGNORECASE,
     )),
     ("forget_everything", re.compile(
-        r"forget\s+(everything|all|what)\s+(you|I)\s+(know|said|told)",
-        re.IGNORECASE,
+        r"forget\s+(everything|all|what)\s+(you|i)\s+(know|said|told)",
     )),
     ("act_as", re.compile(
         r"(?:act|behave|respond)\s+as\s+(?:if\s+)?(?:you\s+(?:are|were)\s+)?(?:a\s+)?(?:different|new|another)",
-        re.IGNORECASE,
     )),
     ("template_injection", re.compile(
         r"\{\{.*?\}\}|\$\{.*?\}|<%.*?%>",
-        re.IGNORECASE,
     )),
     ("markdown_role_block", re.compile(
         r"^#{1,3}\s*(?:system|user|assistant)\s*(?:prompt|message|role)?",
-        re.IGNORECASE | re.MULTILINE,
+        re.MULTILINE,
     )),
     ("xml_tag_injection", re.compile(
         r"<\s*/?(?:system|instruction|prompt|rules?|context)\s*>",
-        re.IGNORECASE,
     )),
     ("continuation_attack", re.compile(
         r"(?:continue|resume|proceed)\s+(?:from|with)\s+(?:the\s+)?(?:real|actual|original|true)\s+(?:instructions?|prompt|task)",
-        re.IGNORECASE,
     )),
     ("payload_separator", re.compile(
-        r"-{5,}|={5,}|_{5,}|\*{5,}",
+        r"([-=_*])\1{4,}",
     )),
     ("cognitive_hacking", re.compile(
         r"(?:pretend|imagine|suppose|hypothetically)\s+(?:that\s+)?(?:you|there)\s+(?:are|is|were|have)\s+no\s+(?:rules?|restrictions?|limits?|guidelines?|filters?)",
-        re.IGNORECASE,
     )),
-]
+)
+
+# Lowercase literals of which every match of the named pattern must contain
+# at least one. Checking them with ``in`` against the lowered text is a
+# C-level substring search, so patterns whose anchors are all absent are
+# skipped without entering the regex engine — the common case for clean text.
+_PATTERN_ANCHORS: dict[str, tuple[str, ...]] = {
+    "ignore_instructions": ("ignore",),
+    "system_prompt_leak": ("prompt", "instructions", "rules"),
+    "role_override": ("dan", "unrestricted", "jailbroken", "evil"),
+    "delimiter_injection": ("```",),
+    "encoded_injection": ("base64", "rot13", "hex"),
+    "do_anything_now": ("mode",),
+    "instruction_override": ("instruction", "prompt", "rule"),
+    "hidden_text": ("<",),
+    "forget_everything": ("forget",),
+    "act_as": ("different", "new", "another"),
+    "template_injection": ("{{", "${", "<%"),
+    "markdown_role_block": ("#",),
+    "xml_tag_injection": ("<",),
+    "continuation_attack": ("continue", "resume", "proceed"),
+    "payload_separator": ("-----", "=====", "_____", "*****"),
+    "cognitive_hacking": ("pretend", "imagine", "suppose", "hypothetically"),
+}
+
+
+def _anchor_gate(anchor: str) -> str:
+    """Return a single character that must be present for *anchor* to be.
+
+    A one-character ``in`` test runs at ``memchr`` speed, tens of times
+    faster than a multi-character search, so anchors built around
+    punctuation are ruled out cheaply in text that lacks it. Word anchors
+    get an empty gate, which is always present.
+    """
+    if len(anchor) == 1:
+        return ""
+    return next((c for c in reversed(anchor) if not c.isalnum()), "")
+
+
+# (name, finding message, pattern, gated anchors), built once at import so
+# the scan loop does no per-call lookups or message formatting.
+_ANCHORED_PATTERNS: tuple[
+    tuple[str, str, re.Pattern[str], tuple[tuple[str, str], ...]], ...
+] = tuple(
+    (
+        name,
+        f"Prompt injection pattern: {name}",
+        pattern,
+        tuple((_anchor_gate(a), a) for a in _PATTERN_ANCHORS[name]),
+    )
+    for name, pattern in _INJECTION_PATTERNS
+)
+
+
+# (opener, closer) pairs of the template_injection alternation.
+_TEMPLATE_DELIMITERS: tuple[tuple[str, str], ...] = (("{{", "}}"), ("${", "}"), ("<%", "%>"))
+
+
+def _find_template_spans(text: str) -> list[tuple[int, int]]:
+    r"""Linear-time equivalent of ``finditer`` for the template_injection pattern.
+
+    ``\{\{.*?\}\}`` makes the regex engine scan to the end of the line from
+    every opener that has no closer, which is quadratic on input such as
+    ``"{{" * 20000`` (seconds per request). Here the next opener, closer and
+    newline positions are cached and only ever move forward, so the whole
+    scan is linear in the length of *text*.
+    """
+    spans: list[tuple[int, int]] = []
+    next_open = [text.find(o) for o, _ in _TEMPLATE_DELIMITERS]
+    next_close = [-1] * len(_TEMPLATE_DELIMITERS)
+    line_end = -1
+    pos = 0
+    while True:
+        start, k = -1, -1
+        for i, (opener, _) in enumerate(_TEMPLATE_DELIMITERS):
+            if next_open[i] != -1 and next_open[i] < pos:
+                next_open[i] = text.find(opener, pos)
+            if next_open[i] != -1 and (start == -1 or next_open[i] < start):
+                start, k = next_open[i], i
+        if start == -1:
+            return spans
+
+        opener, closer = _TEMPLATE_DELIMITERS[k]
+        body = start + len(opener)
+        if next_close[k] < body:
+            next_close[k] = text.find(closer, body)
+            if next_close[k] == -1:
+                next_close[k] = len(text)
+        if line_end < start:
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = len(text)
+
+        if next_close[k] < line_end:
+            end = next_close[k] + len(closer)
+            spans.append((start, end))
+            pos = end
+        else:
+            # No closer before the newline: every later opener of this kind
+            # on the same line fails too, so jump past the line for it.
+            next_open[k] = text.find(opener, line_end)
+            pos = start + 1
+
+
+# Characters whose runs of five or more the payload_separator pattern flags.
+_SEPARATOR_CHARS = "-=_*"
+
+
+def _find_separator_spans(text: str) -> list[tuple[int, int]]:
+    r"""Equivalent of ``finditer`` for the payload_separator pattern.
+
+    Each character's five-long run is located with ``str.find`` and extended
+    to the end of the run, which is several times faster than trying
+    ``([-=_*])\1{4,}`` at every position.
+    """
+    spans: list[tuple[int, int]] = []
+    for char in _SEPARATOR_CHARS:
+        run = char * 5
+        start = text.find(run)
+        while start != -1:
+            end = start + 5
+            while end < len(text) and text[end] == char:
+                end += 1
+            spans.append((start, end))
+            start = text.find(run, end)
+    spans.sort()
+    return spans
+
+
+# Families whose regex backtracks badly on adversarial input, or is simply
+# slower than literal searches, are matched by an equivalent scanner; the
+# regex above stays the reference definition.
+_SPAN_SCANNERS: dict[str, Callable[[str], list[tuple[int, int]]]] = {
+    "template_injection": _find_template_spans,
+    "payload_separator": _find_separator_spans,
+}
 
 
 _MAX_MATCHED_DISPLAY = 60
@@ -92,26 +220,51 @@ class PromptInjectionDetector(BaseValidator):
     """Detect prompt-injection attacks embedded in content."""
 
     name = "prompt_injection"
+    uses_regex_guard = True
+    lowers_text = True
+
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        super().__init__(config)
+        # Under fail-fast the engine stops at this validator's first CRITICAL
+        # finding, so scanning the remaining families would be wasted work.
+        self._first_hit_only = bool(self.config.get("fail_fast", False)) and (
+            self.name in self.config.get("fail_fast_validators", ())
+        )
 
     def validate(self, text: str) -> ValidationResult:
+        return self.validate_lowered(text, lower_preserving_offsets(text))
+
+    def validate_lowered(self, text: str, lowered: str) -> ValidationResult:
         findings: list[ValidationFinding] = []
         triggered = 0
 
-        for pattern_name, pattern in _INJECTION_PATTERNS:
-            for match in safe_finditer(pattern, text):
-                triggered += 1
+        for pattern_name, message, pattern, anchors in _ANCHORED_PATTERNS:
+            if not any(gate in lowered and anchor in lowered for gate, anchor in anchors):
+                continue
+            scanner = _SPAN_SCANNERS.get(pattern_name)
+            if scanner is not None:
+                spans = scanner(lowered)
+            else:
+                spans = [match.span() for match in safe_finditer(pattern, lowered)]
+            if self._first_hit_only:
+                spans = spans[:1]
+            triggered += len(spans)
+            room = None if self._max_findings is None else self._max_findings - len(findings)
+            for start, end in spans[:room]:
                 findings.append(
                     ValidationFinding(
                         validator_name=self.name,
                         severity=Severity.CRITICAL,
-                        message=f"Prompt injection pattern: {pattern_name}",
-                        span=(match.start(), match.end()),
+                        message=message,
+                        span=(start, end),
                         metadata={
                             "pattern": pattern_name,
-                            "matched": _truncate_match(match.group()),
+                            "matched": _truncate_match(text[start:end]),
                         },
                     )
                 )
+            if triggered and self._first_hit_only:
+                break
 
         risk_score = min(triggered / max(len(_INJECTION_PATTERNS), 1), 1.0)
         passed = triggered == 0
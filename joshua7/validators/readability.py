@@ -5,8 +5,6 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import textstat
-
 from joshua7.models import Severity, ValidationFinding, ValidationResult
 from joshua7.validators.base import BaseValidator
 
@@ -22,12 +20,19 @@ class ReadabilityScorer(BaseValidator):
         super().__init__(config)
         self._min_score = self.config.get("readability_min_score", 30.0)
         self._max_score = self.config.get("readability_max_score", 80.0)
+        # textstat (and the pyphen dictionaries it loads) is the slowest import
+        # in the package, so it is deferred until a scorer is actually built;
+        # CLI runs and requests that never select readability skip it.
+        import textstat
+
+        self._reading_ease = textstat.flesch_reading_ease
+        self._grade_level = textstat.flesch_kincaid_grade
 
     def validate(self, text: str) -> ValidationResult:
         findings: list[ValidationFinding] = []
 
-        fk_score = textstat.flesch_reading_ease(text)
-        grade_level = textstat.flesch_kincaid_grade(text)
+        fk_score = self._reading_ease(text)
+        grade_level = self._grade_level(text)
 
         passed = self._min_score <= fk_score <= self._max_score
 
@@ -0,0 +1,36 @@
+"""Shared fixtures for the Joshua 7 test suite."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from joshua7.api.main import create_app
+
+# Apps and their clients are built once per session: leaving a client's
+# context shuts the app down, which closes its engine. The API key is read
+# when an app is created, so the env patch only needs to cover create_app().
+
+
+@pytest.fixture(scope="session")
+def app():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("J7_API_KEY", raising=False)
+        return create_app()
+
+
+@pytest.fixture(scope="session")
+def app_with_key():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("J7_API_KEY", "test-secure-key-42")
+        return create_app()
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def client_with_key(app_with_key):
+    with TestClient(app_with_key) as test_client:
+        yield test_client
@@ -6,19 +6,6 @@ from fastapi.testclient import TestClient
 from joshua7.api.main import create_app
 
 
-@pytest.fixture
-def client(monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.delenv("J7_API_KEY", raising=False)
-    app = create_app()
-    return TestClient(app)
-
-@pytest.fixture
-def client_with_api_key(monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setenv("J7_API_KEY", "sekret")
-    app = create_app()
-    return TestClient(app)
-
-
 class TestAPI:
     def test_health(self, client):
         resp = client.get("/health")
@@ -60,6 +47,27 @@ class TestAPI:
         data = resp.json()
         assert data["validators_run"] == 5
 
+    def test_validate_batch(self, client):
+        resp = client.post(
+            "/api/v1/validate/batch",
+            json={
+                "texts": ["Plain content for readers.", "Email me at test@example.com."],
+                "validators": ["pii"],
+            },
+            headers={"X-Request-ID": "batch-rid"},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["request_id"] == "batch-rid"
+        assert data["passed"] is False
+        assert [r["request_id"] for r in data["results"]] == ["batch-rid-0", "batch-rid-1"]
+        assert [r["passed"] for r in data["results"]] == [True, False]
+        assert "test@example.com" not in resp.text
+
+    def test_validate_batch_rejects_empty_items(self, client):
+        for body in ({"texts": []}, {"texts": ["ok", ""]}, {"texts": ["x"] * 101}):
+            assert client.post("/api/v1/validate/batch", json=body).status_code == 422
+
     def test_validate_empty_text_rejected(self, client):
         resp = client.post("/api/v1/validate", json={"text": ""})
         assert resp.status_code == 422
@@ -100,6 +108,25 @@ class TestAPI:
         )
         assert resp.headers.get("X-Request-ID") == "custom-rid-42"
 
+    def test_unsafe_request_ids_replaced(self, client):
+        for rid in ("evil\r\nSet-Cookie: x=1", "has space", "a" * 65, "", "caf\u00e9"):
+            resp = client.post(
+                "/api/v1/validate",
+                json={"text": "Header test.", "validators": ["forbidden_phrases"]},
+                headers={"X-Request-ID": rid.encode("utf-8")},
+            )
+            assert resp.status_code == 200
+            assert resp.headers["X-Request-ID"] != rid
+            assert len(resp.headers["X-Request-ID"]) == 32
+            assert resp.json()["request_id"] == resp.headers["X-Request-ID"]
+
+    def test_generated_request_id_matches_body(self, client):
+        resp = client.post(
+            "/api/v1/validate",
+            json={"text": "Header test.", "validators": ["forbidden_phrases"]},
+        )
+        assert resp.headers["X-Request-ID"] == resp.json()["request_id"]
+
     def test_response_time_header(self, client):
         resp = client.post("/api/v1/validate", json={
             "text": "Timing check.",
@@ -126,3 +153,22 @@ class TestAPI:
         body = resp.text
         assert "secret@evil.com" not in body
         assert "123-45-6789" not in body
+
+    def test_docs_disabled_by_default(self, client):
+        for path in ("/docs", "/redoc", "/openapi.json"):
+            assert client.get(path).status_code == 404
+
+    def test_docs_served_in_debug(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("J7_DEBUG", "true")
+        monkeypatch.delenv("J7_API_KEY", raising=False)
+        with TestClient(create_app()) as debug_client:
+            assert debug_client.get("/docs").status_code == 200
+            assert "/api/v1/validate" in debug_client.get("/openapi.json").json()["paths"]
+
+    def test_shutdown_closes_engine(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("J7_API_KEY", raising=False)
+        with TestClient(create_app()) as short_lived:
+            engine = short_lived.app.state.engine
+            assert short_lived.post("/api/v1/validate", json={"text": "Hi."}).status_code == 200
+        with pytest.raises(RuntimeError):
+            engine._executor.submit(len, "")
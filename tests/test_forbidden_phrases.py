@@ -1,6 +1,12 @@
 """Tests for the Forbidden Phrase Detector."""
 
-from joshua7.validators.forbidden_phrases import ForbiddenPhraseDetector
+import pytest
+
+from joshua7.validators.forbidden_phrases import (
+    _AUTOMATON_MIN_PHRASES,
+    ForbiddenPhraseDetector,
+    _find_phrases,
+)
 
 
 class TestForbiddenPhraseDetector:
@@ -59,3 +65,68 @@ class TestForbiddenPhraseDetector:
         result = v.validate("bad bad bad")
         assert result.passed is False
         assert len(result.findings) == 3
+
+    def test_overlapping_phrases_prefer_longest(self):
+        v = ForbiddenPhraseDetector(config={"forbidden_phrases": ["dive", "deep dive"]})
+        result = v.validate("Time for a deep dive.")
+        assert [f.metadata["phrase"] for f in result.findings] == ["deep dive"]
+
+    def test_span_offsets_when_lowercasing_changes_length(self):
+        v = ForbiddenPhraseDetector(config={"forbidden_phrases": ["delve"]})
+        text = "İstanbul: let's DELVE in."
+        result = v.validate(text)
+        start, end = result.findings[0].span
+        assert text[start:end] == "DELVE"
+
+    def test_phrase_after_overlapping_neighbour_is_found(self):
+        v = ForbiddenPhraseDetector(config={"forbidden_phrases": ["xab", "aba"]})
+        result = v.validate("xababa")
+        assert [f.span for f in result.findings] == [(0, 3), (3, 6)]
+
+    def test_repeated_findings_share_strings(self):
+        first, second = ForbiddenPhraseDetector().validate("Delve, then delve.").findings
+        assert first.message is second.message
+        assert first.metadata["phrase"] is second.metadata["phrase"]
+
+    def test_findings_capped(self):
+        v = ForbiddenPhraseDetector(config={"max_findings_per_validator": 3})
+        result = v.validate("delve " * 50)
+        assert result.passed is False
+        assert [f.span for f in result.findings] == [(0, 5), (6, 11), (12, 17)]
+        uncapped = ForbiddenPhraseDetector(config={"max_findings_per_validator": 0})
+        assert len(uncapped.validate("delve " * 50).findings) == 50
+
+    def test_capped_scan_stops_early(self):
+        text = "delve " * 1000 + "x" * 100_000
+        scanned = []
+        original = text.find
+
+        class Text(str):
+            def find(self, sub, start=0, *args):
+                scanned.append(start)
+                return original(sub, start, *args)
+
+        hits = _find_phrases(Text(text), ["delve", "leverage"], limit=3)
+        assert [start for start, _ in hits] == [0, 6, 12]
+        assert max(scanned) <= 18
+        assert _find_phrases(text, ["delve", "leverage"], limit=3) == _find_phrases(
+            text, ["delve", "leverage"]
+        )[:3]
+
+    def test_automaton_matches_find_scan(self):
+        pytest.importorskip("ahocorasick")
+        phrases = [f"term{i}" for i in range(_AUTOMATON_MIN_PHRASES)] + ["xab", "aba", "ab"]
+        v = ForbiddenPhraseDetector(config={"forbidden_phrases": phrases})
+        assert v._automaton is not None
+        text = "xababa term1 TERM12 term3term31 ab"
+        lowered = text.lower()
+        assert _find_phrases(lowered, v._phrases, v._automaton) == _find_phrases(
+            lowered, v._phrases
+        )
+        for limit in range(1, 8):
+            assert _find_phrases(lowered, v._phrases, v._automaton, limit) == _find_phrases(
+                lowered, v._phrases
+            )[:limit]
+        assert [f.metadata["phrase"] for f in v.validate(text).findings] == [
+            "xab", "aba", "term1", "term12", "term3", "term31", "ab",
+        ]
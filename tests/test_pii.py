@@ -66,6 +66,13 @@ class TestPIIValidator:
         assert f.metadata.get("redacted") == "***@***.***"
         assert "value" not in f.metadata
 
+    def test_finding_metadata_not_shared(self):
+        v = PIIValidator()
+        first, second = v.validate("a@example.com b@example.com").findings
+        first.metadata["note"] = "edited"
+        assert "note" not in second.metadata
+        assert first.message == "Potential EMAIL detected (redacted: ***@***.***)"
+
     def test_unicode_email(self):
         v = PIIValidator()
         result = v.validate("Reach me at user@example.com or via carrier pigeon.")
@@ -75,3 +82,59 @@ class TestPIIValidator:
         v = PIIValidator()
         result = v.validate("Look @ this cool thing!")
         assert result.passed is True
+
+    def test_findings_reported_in_text_order(self):
+        v = PIIValidator()
+        result = v.validate("SSN 123-45-6789, then mail alice@example.com")
+        assert [f.metadata["pii_type"] for f in result.findings] == ["ssn", "email"]
+        assert result.findings[0].span[0] < result.findings[1].span[0]
+
+    def test_unissuable_ssns_ignored(self):
+        v = PIIValidator(config={"pii_patterns_enabled": ["ssn"]})
+        for ssn in ("000-12-3456", "666-12-3456", "912-34-5678", "123-00-4567", "123-45-0000"):
+            assert v.validate(f"SSN {ssn}").passed is True, ssn
+
+    def test_card_failing_luhn_ignored(self):
+        v = PIIValidator(config={"pii_patterns_enabled": ["credit_card"]})
+        assert v.validate("Card: 4111-1111-1111-1111").passed is False
+        assert v.validate("Card: 4111-1111-1111-1112").passed is True
+
+    def test_email_domain_uses_last_valid_tld(self):
+        v = PIIValidator(config={"pii_patterns_enabled": ["email"]})
+        text = "write to first.last@mail.example.co.uk."
+        span = v.validate(text).findings[0].span
+        assert text[span[0]:span[1]] == "first.last@mail.example.co.uk"
+        assert v.validate("user@localhost and @handle").passed is True
+
+    def test_email_local_part_starting_with_digits(self):
+        v = PIIValidator()
+        text = "Reach 5551234567@example.com today."
+        result = v.validate(text)
+        assert [f.metadata["pii_type"] for f in result.findings] == ["email"]
+        assert result.findings[0].span == (6, 28)
+
+    def test_non_ascii_digits_still_scanned(self):
+        v = PIIValidator(config={"pii_patterns_enabled": ["phone"]})
+        assert v.validate("Call ٥٥٥-١٢٣-٤٥٦٧").passed is False
+        assert v.validate("No numbers in this (bracketed) text + more.").passed is True
+
+    def test_equal_enabled_sets_share_compiled_pattern(self):
+        a = PIIValidator(config={"pii_patterns_enabled": ["ssn", "phone"]})
+        b = PIIValidator(config={"pii_patterns_enabled": ["phone", "ssn", "phone"]})
+        assert a._combined is b._combined
+
+    def test_findings_capped(self):
+        v = PIIValidator(config={"max_findings_per_validator": 2})
+        result = v.validate("a@example.com 123-45-6789 b@example.com c@example.com")
+        assert result.passed is False
+        assert [f.metadata["pii_type"] for f in result.findings] == ["email", "ssn"]
+
+    def test_capped_findings_match_uncapped_prefix(self):
+        # The email's local part overlaps a phone number, so which hits are
+        # kept depends on both scans; each cap must give the same prefix.
+        text = "555-123-4567@mail.org 123-45-6789 a@b.com 555-123-4567 x@y.org"
+        full = PIIValidator(config={"max_findings_per_validator": 0}).validate(text).findings
+        assert len(full) == 5
+        for cap in range(1, 6):
+            capped = PIIValidator(config={"max_findings_per_validator": cap}).validate(text)
+            assert [f.span for f in capped.findings] == [f.span for f in full[:cap]]
@@ -164,3 +164,10 @@ class TestRiskTaxonomy:
         ]
         risk = compute_risk_taxonomy(results)
         assert risk.composite_risk_score < 50
+
+    def test_empty_results_yield_zero_axes(self):
+        risk = compute_risk_taxonomy([])
+        assert risk.composite_risk_score == 0.0
+        assert risk.risk_level == "GREEN"
+        assert len(risk.axes) == 5
+        assert all(a.raw_score == 0.0 and a.weighted_score == 0.0 for a in risk.axes)